@@ -54,7 +54,7 @@ class LeadManager:
         
         return score
     
-    def generate_report(self):
+    def generate_report(self, recent_window_seconds=3600):
         with open(self.leads_file, 'r') as f:
             reader = csv.DictReader(f)
             leads = list(reader)
@@ -62,17 +62,18 @@ class LeadManager:
         report = {
             "total_leads": len(leads),
             "high_score_leads": len([l for l in leads if int(l['lead_score']) > 50]),
-            "new_leads_last_hour": len([l for l in leads if self._is_recent(l['timestamp'])]),
+            "new_leads_recent": len([l for l in leads if self._is_recent(l['timestamp'], recent_window_seconds)]),
+            "recent_window_seconds": recent_window_seconds,
             "top_locations": self._get_top_locations(leads),
             "top_property_types": self._get_top_property_types(leads)
         }
         
         return report
     
-    def _is_recent(self, timestamp):
+    def _is_recent(self, timestamp, window_seconds):
         from datetime import datetime, timedelta
         lead_time = datetime.fromisoformat(timestamp)
-        return (datetime.now() - lead_time) < timedelta(hours=1)
+        return (datetime.now() - lead_time) < timedelta(seconds=window_seconds)
     
     def _get_top_locations(self, leads):
         from collections import Counter
@@ -13,6 +13,7 @@ class Config:
     REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
     REDIS_DB = int(os.getenv("REDIS_DB", 0))
+    SESSION_MAX_IDLE_SECONDS = int(os.getenv("SESSION_MAX_IDLE_SECONDS", 86400))
     
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -29,6 +30,12 @@ class Config:
     EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
     MANAGER_EMAIL = os.getenv("MANAGER_EMAIL")
     
+    # Background Worker
+    INGEST_INTERVAL_SECONDS = int(os.getenv("INGEST_INTERVAL_SECONDS", 900))
+    REPORT_INTERVAL_SECONDS = int(os.getenv("REPORT_INTERVAL_SECONDS", 3600))
+    JOB_LOCK_TTL_SECONDS = int(os.getenv("JOB_LOCK_TTL_SECONDS", 60))
+    SCHEDULER_TICK_SECONDS = int(os.getenv("SCHEDULER_TICK_SECONDS", 5))
+    
     # Lead Scoring
     LEAD_SCORE_WEIGHTS = {
         'contact_shared': 30,
@@ -1,16 +1,19 @@
+import hashlib
+import json
 import pandas as pd
 from config import Config
 from qdrant_client.models import PointStruct
 from .qdrant_connector import QdrantConnector
-from  .utils.embeddings import get_embedding
+from .redis_connector import RedisConnector
+from utils.embeddings import get_embedding
 
 class DataLoader:
-    def __init__(self):
+    def __init__(self, redis_connector=None):
         self.qdrant = QdrantConnector()
+        self.redis = redis_connector or RedisConnector()
     
     def load_property_data(self):
-        df = pd.read_csv(Config.PROPERTY_DATA_PATH)
-        df.fillna("", inplace=True)
+        df = self._read_properties()
         
         # Create collection if not exists
         try:
@@ -19,30 +22,7 @@ class DataLoader:
             print(f"Collection already exists or error: {e}")
         
         # Prepare points for Qdrant
-        points = []
-        for idx, row in df.iterrows():
-            # Combine relevant fields for embedding
-            text_to_embed = f"{row['title']} {row['type']} {row['location']} {row['description']}"
-            
-            points.append(
-                PointStruct(
-                    id=idx,
-                    vector=get_embedding(text_to_embed),
-                    payload={
-                        "id": row['id'],
-                        "title": row['title'],
-                        "price": row['price'],
-                        "type": row['type'],
-                        "bedrooms": row['bedrooms'],
-                        "area": row['area'],
-                        "location": row['location'],
-                        "sector": row['sector'],
-                        "features": row['features'],
-                        "contact": row['contact'],
-                        "description": row['description']
-                    }
-                )
-            )
+        points = [self._build_point(row) for _, row in df.iterrows()]
         
         # Upload to Qdrant
         self.qdrant.client.upsert(
@@ -50,4 +30,75 @@ class DataLoader:
             points=points
         )
         
-        return df
\ No newline at end of file
+        # Record what was embedded so the next delta sync starts from here
+        stored = self.redis.get_ingest_fingerprints()
+        fingerprints = {str(row['id']): self._fingerprint(row) for _, row in df.iterrows()}
+        self.redis.store_ingest_fingerprints(
+            fingerprints,
+            [point_id for point_id in stored if point_id not in fingerprints]
+        )
+        
+        return df
+    
+    def sync_property_data(self):
+        # Re-embed only rows added or changed since the last sync
+        df = self._read_properties()
+        
+        # A freshly created collection is empty, so stored fingerprints no
+        # longer describe what Qdrant holds and every row must be re-embedded
+        if self.qdrant.ensure_collection(vector_size=1536):
+            self.redis.clear_ingest_fingerprints()
+        
+        stored = self.redis.get_ingest_fingerprints()
+        current = {}
+        points = []
+        for _, row in df.iterrows():
+            point_id = str(row['id'])
+            current[point_id] = self._fingerprint(row)
+            if stored.get(point_id) != current[point_id]:
+                points.append(self._build_point(row))
+        
+        removed_ids = [point_id for point_id in stored if point_id not in current]
+        
+        if points:
+            self.qdrant.client.upsert(
+                collection_name=Config.QDRANT_COLLECTION,
+                points=points
+            )
+        if removed_ids:
+            self.qdrant.delete_points(int(point_id) for point_id in removed_ids)
+        
+        changed = {str(point.id): current[str(point.id)] for point in points}
+        self.redis.store_ingest_fingerprints(changed, removed_ids)
+        
+        return {"upserted": len(points), "deleted": len(removed_ids)}
+    
+    def _read_properties(self):
+        # Object dtype lets blank cells in numeric columns become "" on pandas 3
+        return pd.read_csv(Config.PROPERTY_DATA_PATH).astype(object).fillna("")
+    
+    def _build_point(self, row):
+        # Combine relevant fields for embedding
+        text_to_embed = f"{row['title']} {row['type']} {row['location']} {row['description']}"
+        
+        return PointStruct(
+            id=int(row['id']),
+            vector=get_embedding(text_to_embed),
+            payload={
+                "id": row['id'],
+                "title": row['title'],
+                "price": row['price(PKR)'],
+                "type": row['type'],
+                "bedrooms": row['bedrooms'],
+                "area": row['area(sq.yd)'],
+                "location": row['location'],
+                "sector": row['sector'],
+                "features": row['features'],
+                "contact": row['contact'],
+                "description": row['description']
+            }
+        )
+    
+    def _fingerprint(self, row):
+        serialized = json.dumps({k: str(v) for k, v in row.items()}, sort_keys=True)
+        return hashlib.sha256(serialized.encode()).hexdigest()
@@ -24,4 +24,17 @@ class QdrantConnector:
                 "size": vector_size,
                 "distance": "Cosine"
             }
-        )
\ No newline at end of file
+        )
+    
+    def ensure_collection(self, vector_size):
+        existing = [c.name for c in self.client.get_collections().collections]
+        if self.collection_name in existing:
+            return False
+        self.create_collection(vector_size)
+        return True
+    
+    def delete_points(self, point_ids):
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=list(point_ids)
+        )
@@ -1,6 +1,23 @@
+import uuid
 import redis
 from config import Config
 
+# Compare-and-delete so a worker never releases a lock another worker now holds
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Compare-and-expire so only the current holder can keep a lock alive
+EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
 class RedisConnector:
     def __init__(self):
         self.connection = redis.Redis(
@@ -11,13 +28,65 @@ class RedisConnector:
         )
     
     def store_session(self, session_id, data):
-        self.connection.hset(f"session:{session_id}", mapping=data)
+        self._write_session(session_id, mapping=data)
     
     def get_session(self, session_id):
         return self.connection.hgetall(f"session:{session_id}")
     
     def update_session_field(self, session_id, field, value):
-        self.connection.hset(f"session:{session_id}", field, value)
+        self._write_session(session_id, field, value)
     
     def delete_session(self, session_id):
-        self.connection.delete(f"session:{session_id}")
\ No newline at end of file
+        self.connection.delete(f"session:{session_id}")
+    
+    def _write_session(self, session_id, field=None, value=None, mapping=None):
+        # Every write pushes the expiry back, so only idle sessions age out
+        key = f"session:{session_id}"
+        pipe = self.connection.pipeline()
+        pipe.hset(key, field, value, mapping=mapping)
+        pipe.expire(key, Config.SESSION_MAX_IDLE_SECONDS)
+        pipe.execute()
+    
+    def backfill_session_ttls(self):
+        # Sessions written before expiry was added have no TTL; give them one
+        # once, then skip the full keyspace scan on later worker starts
+        if self.connection.exists("sessions:ttl_backfilled"):
+            return 0
+        updated = 0
+        for key in self.connection.scan_iter(match="session:*", count=500):
+            if self.connection.ttl(key) == -1:
+                self.connection.expire(key, Config.SESSION_MAX_IDLE_SECONDS)
+                updated += 1
+        self.connection.set("sessions:ttl_backfilled", 1)
+        return updated
+    
+    def acquire_lock(self, name, ttl_seconds):
+        token = uuid.uuid4().hex
+        if self.connection.set(f"lock:{name}", token, nx=True, ex=ttl_seconds):
+            return token
+        return None
+    
+    def release_lock(self, name, token):
+        self.connection.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{name}", token)
+    
+    def extend_lock(self, name, token, ttl_seconds):
+        return bool(self.connection.eval(EXTEND_LOCK_SCRIPT, 1, f"lock:{name}", token, ttl_seconds))
+    
+    def get_last_run(self, job_name):
+        value = self.connection.get(f"scheduler:last_run:{job_name}")
+        return float(value) if value else None
+    
+    def set_last_run(self, job_name, timestamp):
+        self.connection.set(f"scheduler:last_run:{job_name}", timestamp)
+    
+    def get_ingest_fingerprints(self):
+        return self.connection.hgetall("ingest:fingerprints")
+    
+    def clear_ingest_fingerprints(self):
+        self.connection.delete("ingest:fingerprints")
+    
+    def store_ingest_fingerprints(self, fingerprints, removed_ids=()):
+        if fingerprints:
+            self.connection.hset("ingest:fingerprints", mapping=fingerprints)
+        if removed_ids:
+            self.connection.hdel("ingest:fingerprints", *removed_ids)
@@ -110,7 +110,9 @@ class RealEstateChatbot:
                 collection_name=Config.QDRANT_COLLECTION,
                 ids=[prop_id]
             )
-            if result:
+            # Point ids are the CSV property ids; skip any point whose payload
+            # disagrees rather than show details for the wrong listing
+            if result and str(result[0].payload['id']) == str(prop_id):
                 detailed_properties.append(result[0].payload)
 
         # Format detailed response
@@ -0,0 +1,84 @@
+import fnmatch
+import os
+
+import pytest
+
+# utils.embeddings builds an OpenAI client at import time
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from database import redis_connector
+from database.redis_connector import RedisConnector
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis-py calls RedisConnector makes."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+    def hset(self, name, key=None, value=None, mapping=None):
+        hash_ = self.data.setdefault(name, {})
+        if key is not None:
+            hash_[key] = str(value)
+        for k, v in (mapping or {}).items():
+            hash_[k] = str(v)
+
+    def hgetall(self, name):
+        return dict(self.data.get(name, {}))
+
+    def hdel(self, name, *keys):
+        for key in keys:
+            self.data.get(name, {}).pop(key, None)
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, nx=False, ex=None):
+        if nx and name in self.data:
+            return None
+        self.data[name] = str(value)
+        if ex is not None:
+            self.ttls[name] = ex
+        return True
+
+    def exists(self, name):
+        return int(name in self.data)
+
+    def delete(self, name):
+        self.data.pop(name, None)
+        self.ttls.pop(name, None)
+
+    def expire(self, name, seconds):
+        if name in self.data:
+            self.ttls[name] = seconds
+
+    def ttl(self, name):
+        if name not in self.data:
+            return -2
+        return self.ttls.get(name, -1)
+
+    def scan_iter(self, match="*", count=None):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+    def eval(self, script, numkeys, key, token, *args):
+        if self.data.get(key) != token:
+            return 0
+        if script == redis_connector.RELEASE_LOCK_SCRIPT:
+            self.delete(key)
+        elif script == redis_connector.EXTEND_LOCK_SCRIPT:
+            self.ttls[key] = int(args[0])
+        return 1
+
+
+@pytest.fixture
+def fake_redis():
+    connector = RedisConnector.__new__(RedisConnector)
+    connector.connection = FakeRedis()
+    return connector
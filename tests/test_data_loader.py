@@ -0,0 +1,86 @@
+import shutil
+
+import pandas as pd
+import pytest
+from qdrant_client import QdrantClient
+
+from config import Config
+from database import data_loader, qdrant_connector
+from database.data_loader import DataLoader
+
+
+@pytest.fixture
+def loader(fake_redis, tmp_path, monkeypatch):
+    csv_path = tmp_path / "properties.csv"
+    shutil.copy(Config.PROPERTY_DATA_PATH, csv_path)
+    monkeypatch.setattr(Config, "PROPERTY_DATA_PATH", str(csv_path))
+
+    embedded = []
+
+    def fake_embedding(text):
+        embedded.append(text)
+        return [0.1] * 1536
+
+    monkeypatch.setattr(data_loader, "get_embedding", fake_embedding)
+    monkeypatch.setattr(qdrant_connector, "QdrantClient", lambda **kwargs: QdrantClient(":memory:"))
+
+    loader = DataLoader(fake_redis)
+    loader.embedded = embedded
+    loader.csv_path = csv_path
+    return loader
+
+
+def point_count(loader):
+    return loader.qdrant.client.count(Config.QDRANT_COLLECTION).count
+
+
+def test_sync_embeds_shipped_csv_keyed_by_property_id(loader):
+    df = pd.read_csv(loader.csv_path)
+
+    result = loader.sync_property_data()
+
+    assert result == {"upserted": len(df), "deleted": 0}
+    assert point_count(loader) == len(df)
+    first = df.iloc[0]
+    point = loader.qdrant.client.retrieve(Config.QDRANT_COLLECTION, ids=[int(first["id"])])[0]
+    assert point.payload["title"] == first["title"]
+    assert point.payload["price"] == first["price(PKR)"]
+    assert point.payload["area"] == first["area(sq.yd)"]
+
+
+def test_unchanged_sync_embeds_nothing(loader):
+    loader.sync_property_data()
+    loader.embedded.clear()
+
+    assert loader.sync_property_data() == {"upserted": 0, "deleted": 0}
+    assert loader.embedded == []
+
+
+def test_sync_only_touches_changed_inserted_and_removed_rows(loader):
+    loader.sync_property_data()
+    df = pd.read_csv(loader.csv_path)
+    removed_id = int(df.iloc[5]["id"])
+    new_row = df.iloc[[0]].copy()
+    new_row["id"] = df["id"].max() + 1
+    df.loc[2, "description"] = "Freshly renovated"
+    df = pd.concat([df.iloc[:3], new_row, df.iloc[3:5], df.iloc[6:]])
+    df.to_csv(loader.csv_path, index=False)
+    loader.embedded.clear()
+
+    result = loader.sync_property_data()
+
+    assert result == {"upserted": 2, "deleted": 1}
+    assert len(loader.embedded) == 2
+    assert loader.qdrant.client.retrieve(Config.QDRANT_COLLECTION, ids=[removed_id]) == []
+    assert point_count(loader) == len(df)
+
+
+def test_missing_collection_triggers_full_reembed(loader):
+    df = pd.read_csv(loader.csv_path)
+    loader.sync_property_data()
+    loader.qdrant.client.delete_collection(Config.QDRANT_COLLECTION)
+
+    result = loader.sync_property_data()
+
+    assert result == {"upserted": len(df), "deleted": 0}
+    assert point_count(loader) == len(df)
@@ -0,0 +1,47 @@
+from config import Config
+
+
+def test_session_writes_set_idle_expiry(fake_redis):
+    fake_redis.store_session("abc", {"session_id": "abc", "location": ""})
+    fake_redis.connection.ttls["session:abc"] = 5
+
+    fake_redis.update_session_field("abc", "location", "I-8")
+
+    assert fake_redis.get_session("abc")["location"] == "I-8"
+    assert fake_redis.connection.ttl("session:abc") == Config.SESSION_MAX_IDLE_SECONDS
+
+
+def test_backfill_sets_ttl_on_legacy_sessions_once(fake_redis):
+    conn = fake_redis.connection
+    conn.hset("session:old", mapping={"session_id": "old"})
+    fake_redis.store_session("new", {"session_id": "new"})
+    conn.ttls["session:new"] = 42
+
+    assert fake_redis.backfill_session_ttls() == 1
+    assert conn.ttl("session:old") == Config.SESSION_MAX_IDLE_SECONDS
+    assert conn.ttl("session:new") == 42
+
+    conn.hset("session:later", mapping={"session_id": "later"})
+    assert fake_redis.backfill_session_ttls() == 0
+    assert conn.ttl("session:later") == -1
+
+
+def test_lock_is_exclusive_and_only_released_by_holder(fake_redis):
+    token = fake_redis.acquire_lock("job:x", 30)
+
+    assert token
+    assert fake_redis.acquire_lock("job:x", 30) is None
+
+    fake_redis.release_lock("job:x", "someone-else")
+    assert fake_redis.acquire_lock("job:x", 30) is None
+
+    fake_redis.release_lock("job:x", token)
+    assert fake_redis.acquire_lock("job:x", 30)
+
+
+def test_extend_lock_requires_current_token(fake_redis):
+    token = fake_redis.acquire_lock("job:x", 30)
+
+    assert fake_redis.extend_lock("job:x", token, 90)
+    assert fake_redis.connection.ttl("lock:job:x") == 90
+    assert not fake_redis.extend_lock("job:x", "stale", 90)
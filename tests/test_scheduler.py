@@ -0,0 +1,102 @@
+import time
+
+from utils.scheduler import JobScheduler
+
+
+def make_scheduler(fake_redis, calls, interval=60):
+    scheduler = JobScheduler(fake_redis, tick_seconds=0, lock_ttl_seconds=30)
+    scheduler.add_job("demo", lambda: calls.append(1), interval)
+    return scheduler
+
+
+def test_job_runs_when_due_and_not_again_within_interval(fake_redis):
+    calls = []
+    scheduler = make_scheduler(fake_redis, calls)
+
+    scheduler.run_pending()
+    scheduler.run_pending()
+
+    assert calls == [1]
+    assert fake_redis.get_last_run("demo") is not None
+    assert fake_redis.acquire_lock("job:demo", 30)
+
+
+def test_job_runs_again_once_interval_has_passed(fake_redis):
+    calls = []
+    scheduler = make_scheduler(fake_redis, calls)
+    fake_redis.set_last_run("demo", time.time() - 61)
+
+    scheduler.run_pending()
+
+    assert calls == [1]
+
+
+def test_job_skipped_while_another_worker_holds_lock(fake_redis):
+    calls = []
+    scheduler = make_scheduler(fake_redis, calls)
+    fake_redis.acquire_lock("job:demo", 30)
+
+    scheduler.run_pending()
+
+    assert calls == []
+
+
+def test_due_check_is_repeated_under_lock(fake_redis, monkeypatch):
+    calls = []
+    scheduler = make_scheduler(fake_redis, calls)
+
+    # Another replica records a run between the first check and the lock
+    original_acquire = fake_redis.acquire_lock
+
+    def acquire_after_other_run(name, ttl):
+        fake_redis.set_last_run("demo", time.time())
+        return original_acquire(name, ttl)
+
+    monkeypatch.setattr(fake_redis, "acquire_lock", acquire_after_other_run)
+    scheduler.run_pending()
+
+    assert calls == []
+
+
+def test_failing_job_still_records_run_and_releases_lock(fake_redis):
+    def boom():
+        raise RuntimeError("boom")
+
+    scheduler = JobScheduler(fake_redis, tick_seconds=0, lock_ttl_seconds=30)
+    scheduler.add_job("demo", boom, 60)
+
+    scheduler.run_pending()
+
+    assert fake_redis.get_last_run("demo") is not None
+    assert fake_redis.acquire_lock("job:demo", 30)
+
+
+def test_redis_errors_do_not_escape_run_pending(fake_redis, monkeypatch):
+    calls = []
+    scheduler = make_scheduler(fake_redis, calls)
+
+    def unavailable(job_name):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(fake_redis, "get_last_run", unavailable)
+    scheduler.run_pending()
+
+    assert calls == []
+
+
+def test_lock_is_renewed_while_long_job_runs(fake_redis):
+    renewals = []
+    original_extend = fake_redis.extend_lock
+
+    def record_extend(name, token, ttl):
+        renewals.append(name)
+        return original_extend(name, token, ttl)
+
+    fake_redis.extend_lock = record_extend
+    scheduler = JobScheduler(fake_redis, tick_seconds=0, lock_ttl_seconds=0.06)
+    scheduler.add_job("slow", lambda: time.sleep(0.1), 60)
+
+    scheduler.run_pending()
+
+    assert renewals
+    assert all(name == "job:slow" for name in renewals)
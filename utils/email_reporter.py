@@ -29,7 +29,7 @@ class EmailReporter:
                 <ul>
                     <li>Total leads: {report_data['total_leads']}</li>
                     <li>High score leads: {report_data['high_score_leads']}</li>
-                    <li>New leads in last hour: {report_data['new_leads_last_hour']}</li>
+                    <li>New leads in last {self._format_window(report_data['recent_window_seconds'])}: {report_data['new_leads_recent']}</li>
                 </ul>
                 
                 <h3>Top Locations</h3>
@@ -55,4 +55,11 @@ class EmailReporter:
             return True
         except Exception as e:
             print(f"Error sending email: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _format_window(self, seconds):
+        if seconds == 3600:
+            return "hour"
+        if seconds % 3600 == 0:
+            return f"{seconds // 3600} hours"
+        return f"{seconds // 60} minutes"
@@ -0,0 +1,71 @@
+import threading
+import time
+from datetime import datetime
+
+class JobScheduler:
+    def __init__(self, redis_connector, tick_seconds=5, lock_ttl_seconds=60):
+        self.redis = redis_connector
+        self.tick_seconds = tick_seconds
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.jobs = []
+
+    def add_job(self, name, func, interval_seconds):
+        self.jobs.append({"name": name, "func": func, "interval": interval_seconds})
+
+    def run_pending(self):
+        for job in self.jobs:
+            # A Redis outage must not stop the worker; the job is retried next tick
+            try:
+                self._run_if_due(job)
+            except Exception as e:
+                print(f"[{datetime.now().isoformat()}] Scheduler error for {job['name']}: {e}")
+
+    def run_forever(self):
+        print(f"Scheduler started with jobs: {', '.join(job['name'] for job in self.jobs)}")
+        while True:
+            self.run_pending()
+            time.sleep(self.tick_seconds)
+
+    def _run_if_due(self, job):
+        # Cheap check first so idle replicas don't contend for the lock every tick
+        if not self._is_due(job):
+            return
+
+        token = self.redis.acquire_lock(f"job:{job['name']}", self.lock_ttl_seconds)
+        if not token:
+            return
+
+        # Keep the lock alive for as long as the job runs, however long that is
+        stop_renewal = threading.Event()
+        renewal = threading.Thread(
+            target=self._renew_lock, args=(job, token, stop_renewal), daemon=True
+        )
+        renewal.start()
+        try:
+            # Re-check under the lock so a job another replica just finished is not repeated
+            if not self._is_due(job):
+                return
+            started = time.time()
+            try:
+                result = job["func"]()
+                print(f"[{datetime.now().isoformat()}] Job {job['name']} finished: {result}")
+            except Exception as e:
+                print(f"[{datetime.now().isoformat()}] Job {job['name']} failed: {e}")
+            self.redis.set_last_run(job["name"], started)
+        finally:
+            stop_renewal.set()
+            renewal.join()
+            self.redis.release_lock(f"job:{job['name']}", token)
+
+    def _renew_lock(self, job, token, stop_renewal):
+        while not stop_renewal.wait(self.lock_ttl_seconds / 3):
+            try:
+                if not self.redis.extend_lock(f"job:{job['name']}", token, self.lock_ttl_seconds):
+                    print(f"[{datetime.now().isoformat()}] Lost lock for {job['name']}")
+                    return
+            except Exception as e:
+                print(f"[{datetime.now().isoformat()}] Could not renew lock for {job['name']}: {e}")
+
+    def _is_due(self, job):
+        last_run = self.redis.get_last_run(job["name"])
+        return last_run is None or time.time() - last_run >= job["interval"]
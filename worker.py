@@ -0,0 +1,43 @@
+from database.redis_connector import RedisConnector
+from database.data_loader import DataLoader
+from chatbot.lead_management import LeadManager
+from utils.email_reporter import EmailReporter
+from utils.scheduler import JobScheduler
+from config import Config
+
+class BackgroundWorker:
+    def __init__(self):
+        self.redis = RedisConnector()
+        self.data_loader = DataLoader(self.redis)
+        self.lead_manager = LeadManager()
+        self.email_reporter = EmailReporter()
+        self.scheduler = JobScheduler(
+            self.redis,
+            tick_seconds=Config.SCHEDULER_TICK_SECONDS,
+            lock_ttl_seconds=Config.JOB_LOCK_TTL_SECONDS
+        )
+
+        self.scheduler.add_job("property_ingest", self.ingest_properties, Config.INGEST_INTERVAL_SECONDS)
+        self.scheduler.add_job("lead_digest", self.send_lead_digest, Config.REPORT_INTERVAL_SECONDS)
+
+    def ingest_properties(self):
+        return self.data_loader.sync_property_data()
+
+    def send_lead_digest(self):
+        if not (Config.SMTP_SERVER and Config.MANAGER_EMAIL):
+            return "skipped, SMTP_SERVER or MANAGER_EMAIL not configured"
+        # Count new leads over the same window the digest covers
+        report = self.lead_manager.generate_report(recent_window_seconds=Config.REPORT_INTERVAL_SECONDS)
+        return "sent" if self.email_reporter.send_report(report) else "send failed"
+
+    def run(self):
+        # Sessions expire through key TTLs; only pre-existing ones need a TTL set
+        try:
+            updated = self.redis.backfill_session_ttls()
+            print(f"Session TTL backfill set expiry on {updated} sessions")
+        except Exception as e:
+            print(f"Session TTL backfill failed: {e}")
+        self.scheduler.run_forever()
+
+if __name__ == "__main__":
+    BackgroundWorker().run()